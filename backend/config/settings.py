@@ -89,6 +89,7 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",  # Vite default port
     "http://localhost:3000",  # Alternative frontend port
 ]
+CORS_EXPOSE_HEADERS = ['X-Audio-Shape', 'X-Sample-Rate']
 
 # REST Framework settings
 REST_FRAMEWORK = {
@@ -104,11 +105,42 @@ REST_FRAMEWORK = {
 # Celery Configuration
 CELERY_BROKER_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
-CELERY_ACCEPT_CONTENT = ['json']
-CELERY_TASK_SERIALIZER = 'json'
-CELERY_RESULT_SERIALIZER = 'json'
+# Audio travels between web and worker as raw numpy bytes, which JSON cannot
+# carry. Both sides unpickle: the worker loads tasks from the broker, and the
+# web process loads results in task_status for any task id in the URL.
+# Unpickling runs code, so Redis must only be reachable by this deployment:
+# docker-compose binds it to loopback, and anywhere else it needs a password
+# in REDIS_URL.
+CELERY_ACCEPT_CONTENT = ['pickle', 'json']
+CELERY_TASK_SERIALIZER = 'pickle'
+CELERY_RESULT_SERIALIZER = 'pickle'
 CELERY_TIMEZONE = TIME_ZONE
+# Worker processes keep loaded schemes for their whole life; recycling is
+# opt-in because every new child has to import qiskit and reload them
+if os.getenv('CELERY_WORKER_MAX_TASKS_PER_CHILD'):
+    CELERY_WORKER_MAX_TASKS_PER_CHILD = int(os.getenv('CELERY_WORKER_MAX_TASKS_PER_CHILD'))
+# Buffer pool processes started by each worker process for long clips.
+# Every worker process gets its own pool, so keep this small.
+QUANTUM_POOL_PROCESSES = int(os.getenv('QUANTUM_POOL_PROCESSES', '2'))
 
 # File upload settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
-DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
\ No newline at end of file
+DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
+# Logging - set LOG_LEVEL=DEBUG to see per-request processing details
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'quantumsynth': {
+            'handlers': ['console'],
+            'level': os.getenv('LOG_LEVEL', 'INFO'),
+            # Celery's worker also logs through root; don't print twice
+            'propagate': False,
+        },
+    },
+}
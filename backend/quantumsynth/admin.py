@@ -11,13 +11,22 @@ class QuantumPatchAdmin(admin.ModelAdmin):
     list_filter = ['scheme', 'created_at']
     search_fields = ['name', 'description']
     readonly_fields = ['created_at', 'updated_at']
+    
+    def get_queryset(self, request):
+        # The list never shows these, and parameters JSON can be large
+        return super().get_queryset(request).defer('parameters', 'description')
 
 
 @admin.register(ProcessedSample)
 class ProcessedSampleAdmin(admin.ModelAdmin):
     list_display = ['patch', 'duration', 'sample_rate', 'created_at']
     list_filter = ['patch', 'created_at']
+    list_select_related = ['patch']
     readonly_fields = ['created_at']
     
+    def get_queryset(self, request):
+        # output_audio can hold megabytes of audio per row
+        return super().get_queryset(request).defer('output_audio')
+    
     def has_add_permission(self, request):
         return False  # Samples are created programmatically
@@ -0,0 +1,78 @@
+"""
+Audio helpers shared by the API views and Celery tasks
+
+Kept free of Django imports so spawned pool processes can import it.
+"""
+from functools import lru_cache
+import quantumaudio
+import numpy as np
+
+# Schemes that encode every channel; all others take mono audio
+MULTI_CHANNEL_SCHEMES = ('mqsm', 'msqpam')
+
+
+@lru_cache(maxsize=8)
+def get_scheme(name: str):
+    """
+    Load a quantumaudio scheme once per process
+
+    Prefork workers are reused across tasks, so the scheme (and its
+    backend setup) is built on the first task and shared afterwards.
+    """
+    return quantumaudio.load_scheme(name)
+
+
+def process_buffer(args: tuple) -> np.ndarray:
+    """
+    Run one buffer through the quantum circuit
+
+    Shared by the buffer pool processes and the process_chunk task; takes
+    a single (chunk, scheme, shots) tuple so it can be mapped over a pool.
+    """
+    chunk, scheme, shots = args
+    qa_scheme = get_scheme(scheme)
+    if qa_scheme is None:
+        raise ValueError(f"Scheme '{scheme}' returned None - may not be implemented")
+    return qa_scheme.decode(qa_scheme.encode(chunk, verbose=0), shots=shots)
+
+
+def effective_shots(shots: int, num_samples: int) -> int:
+    """
+    Cap the number of quantum measurements for short audio
+
+    Simulation cost grows linearly with shots, while a short clip gains
+    nothing from more measurements than a few per sample.
+    """
+    return min(shots, max(1000, num_samples * 4))
+
+
+def effective_buffer_size(buffer_size: int, num_samples: int) -> int:
+    """
+    Cap the buffer size to match the length of the audio
+
+    Uses roughly an eighth of the clip, kept within 64-256 samples, so short
+    clips get correspondingly small circuits. The result is always a power
+    of two, the shape the encoding schemes work on natively.
+    """
+    sized = 1 << max(num_samples.bit_length() - 3, 0)
+    capped = min(buffer_size, max(64, min(sized, 256)))
+    return 1 << (capped.bit_length() - 1)
+
+
+def split_buffers(data: np.ndarray, buffer_size: int) -> list:
+    """
+    Split audio into equal buffers along the sample axis
+
+    The last buffer is zero-padded to full length so every circuit gets
+    the same shape; callers drop the padding when joining the output.
+    Returns (offset, buffer) pairs.
+    """
+    num_samples = data.shape[-1]
+    buffers = []
+    for start in range(0, num_samples, buffer_size):
+        chunk = data[..., start:start + buffer_size]
+        if chunk.shape[-1] < buffer_size:
+            padding = [(0, 0)] * (chunk.ndim - 1) + [(0, buffer_size - chunk.shape[-1])]
+            chunk = np.pad(chunk, padding)
+        buffers.append((start, chunk))
+    return buffers
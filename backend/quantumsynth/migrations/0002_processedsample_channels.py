@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-15 22:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quantumsynth', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processedsample',
+            name='channels',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+    ]
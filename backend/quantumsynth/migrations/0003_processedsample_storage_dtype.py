@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-15 22:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quantumsynth', '0002_processedsample_channels'),
+    ]
+
+    operations = [
+        # Rows written before this migration hold float32 audio
+        migrations.AddField(
+            model_name='processedsample',
+            name='storage_dtype',
+            field=models.CharField(default='float32', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='processedsample',
+            name='storage_dtype',
+            field=models.CharField(default='int16', max_length=8),
+        ),
+    ]
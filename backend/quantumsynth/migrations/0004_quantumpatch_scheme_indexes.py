@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-15 22:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quantumsynth', '0003_processedsample_storage_dtype'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quantumpatch',
+            index=models.Index(fields=['scheme'], name='quantumsynt_scheme_b50a36_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quantumpatch',
+            index=models.Index(fields=['scheme', 'name'], name='quantumsynt_scheme_6c0102_idx'),
+        ),
+    ]
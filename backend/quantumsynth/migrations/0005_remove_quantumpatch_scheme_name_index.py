@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:13
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quantumsynth', '0004_quantumpatch_scheme_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='quantumpatch',
+            name='quantumsynt_scheme_6c0102_idx',
+        ),
+    ]
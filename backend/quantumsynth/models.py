@@ -4,6 +4,10 @@ Models for Quantum Synth application
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+# Patches holding cached samples for uploads made without a patch; the API
+# refuses user patch names with this prefix
+CACHE_PATCH_PREFIX = '__cache__-'
+
 
 class QuantumPatch(models.Model):
     """
@@ -31,6 +35,9 @@ class QuantumPatch(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['scheme']),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.get_scheme_display()})"
@@ -47,7 +54,9 @@ class ProcessedSample(models.Model):
     )
     input_hash = models.CharField(max_length=64, db_index=True)
     output_audio = models.BinaryField()
+    storage_dtype = models.CharField(max_length=8, default='int16')
     sample_rate = models.IntegerField(default=22050)
+    channels = models.PositiveSmallIntegerField(default=1)
     duration = models.FloatField()
     created_at = models.DateTimeField(auto_now_add=True)
     
@@ -2,7 +2,7 @@
 Serializers for Quantum Synth API
 """
 from rest_framework import serializers
-from .models import QuantumPatch, ProcessedSample
+from .models import QuantumPatch, ProcessedSample, CACHE_PATCH_PREFIX
 
 
 class QuantumPatchSerializer(serializers.ModelSerializer):
@@ -23,6 +23,13 @@ class QuantumPatchSerializer(serializers.ModelSerializer):
             'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
+    
+    def validate_name(self, value):
+        if value.startswith(CACHE_PATCH_PREFIX):
+            raise serializers.ValidationError(
+                f"Patch names starting with '{CACHE_PATCH_PREFIX}' are reserved"
+            )
+        return value
 
 
 class ProcessedSampleSerializer(serializers.ModelSerializer):
@@ -2,77 +2,291 @@
 Celery tasks for quantum audio processing
 """
 from celery import shared_task
+from celery.signals import worker_process_shutdown
+from billiard import get_context
+from django.conf import settings
+from functools import lru_cache
+import logging
 import quantumaudio
 import numpy as np
-import io
 import soundfile as sf
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from .audio import (
+    MULTI_CHANNEL_SCHEMES,
+    get_scheme,
+    process_buffer,
+    effective_shots,
+    effective_buffer_size,
+    split_buffers
+)
+from .models import QuantumPatch, ProcessedSample, CACHE_PATCH_PREFIX
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _get_pool():
+    """
+    Process pool for buffer fan-out, started once per worker process
+
+    Children are spawned rather than forked: forking after qiskit-aer has
+    run leaves the children deadlocked on its OpenMP thread pool. The pool
+    lives as long as the worker process, so the spawn and import cost is
+    paid once per worker process rather than once per task. Every worker
+    process has its own pool, hence the small QUANTUM_POOL_PROCESSES size.
+    """
+    return get_context('spawn').Pool(processes=settings.QUANTUM_POOL_PROCESSES)
+
+
+@worker_process_shutdown.connect
+def _close_pool(**kwargs):
+    """
+    Stop the buffer pool along with the worker process that started it
+    """
+    if _get_pool.cache_info().currsize:
+        pool = _get_pool()
+        pool.close()
+        pool.join()
+        _get_pool.cache_clear()
+
+
+def _parallel_stream(
+    data: np.ndarray,
+    scheme: str,
+    shots: int,
+    buffer_size: int
+) -> np.ndarray:
+    """
+    Process non-overlapping buffers of audio across a process pool
+
+    Buffers are independent, so this matches quantumaudio.stream() but
+    spreads the circuits over every core. billiard is used rather than
+    multiprocessing because Celery worker processes may not start children
+    otherwise.
+    """
+    num_samples = data.shape[-1]
+    buffers = split_buffers(data, buffer_size)
+    chunks = [(chunk, scheme, shots) for _, chunk in buffers]
+    
+    # Write each buffer into its slot as it arrives rather than
+    # collecting a list of arrays and concatenating them
+    processed = np.empty(data.shape, dtype=np.float32)
+    for (start, _), chunk_out in zip(buffers, _get_pool().imap(process_buffer, chunks)):
+        chunk_out = chunk_out[..., :num_samples - start]  # drop zero padding
+        processed[..., start:start + chunk_out.shape[-1]] = chunk_out
+    return processed
+
+
+def _store_sample(
+    input_hash: str,
+    processed: np.ndarray,
+    scheme: str,
+    shots: int,
+    buffer_size: int,
+    sample_rate: int
+) -> None:
+    """
+    Persist processed audio so repeat uploads can skip the quantum circuit
+
+    Measured audio carries far less than float32 precision, so it is
+    stored as int16 PCM at half the size. Expects audio already clipped.
+    A failed write is logged rather than raised so the result still
+    reaches the caller.
+    """
+    try:
+        # Cache lookups filter on patch__scheme, so match the scheme as well
+        patch, _ = QuantumPatch.objects.get_or_create(
+            name=f'{CACHE_PATCH_PREFIX}{scheme}',
+            scheme=scheme,
+            defaults={
+                'shots': shots,
+                'buffer_size': buffer_size,
+                'description': 'Holds cached samples processed without a patch',
+            }
+        )
+        ProcessedSample.objects.create(
+            patch=patch,
+            input_hash=input_hash,
+            output_audio=np.rint(processed * 32767).astype(np.int16).tobytes(),
+            storage_dtype='int16',
+            sample_rate=sample_rate,
+            channels=processed.shape[0] if processed.ndim > 1 else 1,
+            duration=processed.shape[-1] / sample_rate
+        )
+    except Exception:
+        logger.exception("Failed to cache processed sample %s", input_hash)
+
+
+def _build_result(
+    processed: np.ndarray,
+    scheme: str,
+    shots: int,
+    buffer_size: int,
+    sample_rate: int,
+    input_hash: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Clip processed audio, cache it when input_hash is set and wrap it
+    with its metadata as a task result
+    """
+    # Ensure output is float32 and normalized, clipping in place
+    processed = processed.astype(np.float32, copy=False)
+    np.clip(processed, -1.0, 1.0, out=processed)
+    
+    logger.debug("Processed length: %s", processed.shape[-1])
+    
+    if input_hash:
+        _store_sample(input_hash, processed, scheme, shots, buffer_size, sample_rate)
+    
+    return {
+        'status': 'success',
+        'audio': processed,
+        'metadata': {
+            'scheme': scheme,
+            'shots': shots,
+            'buffer_size': buffer_size,
+            'sample_rate': sample_rate,
+            'samples': processed.shape[-1],
+            'duration': processed.shape[-1] / sample_rate
+        }
+    }
 
 
 @shared_task(bind=True, name='quantumsynth.process_quantum_audio')
 def process_quantum_audio(
     self,
-    audio_data: list,
+    audio_bytes: bytes,
+    shape: tuple,
     scheme: str = 'qpam',
     shots: int = 4000,
     buffer_size: int = 256,
-    sample_rate: int = 22050
+    sample_rate: int = 22050,
+    input_hash: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Process audio through quantum circuit
     
     Args:
-        audio_data: List of audio samples (normalized -1.0 to 1.0)
+        audio_bytes: Raw float32 audio samples (normalized -1.0 to 1.0)
+        shape: Shape of the audio array encoded in audio_bytes
         scheme: Quantum encoding scheme to use
         shots: Number of quantum measurements
         buffer_size: Size of processing chunks
         sample_rate: Audio sample rate
+        input_hash: Cache key of the upload; when set the result is stored
         
     Returns:
-        Dictionary containing processed audio and metadata
+        Dictionary containing processed audio (float32 ndarray) and metadata
     """
     try:
-        # Convert list back to numpy array
-        data = np.array(audio_data, dtype=np.float32)
+        # View the raw payload as a numpy array without copying
+        data = np.frombuffer(audio_bytes, dtype=np.float32).reshape(shape)
+        num_samples = data.shape[-1]
+        shots = effective_shots(shots, num_samples)
+        buffer_size = effective_buffer_size(buffer_size, num_samples)
 
-        print(f"[CELERY DEBUG] Received data length: {len(data)}")
-        print(f"[CELERY DEBUG] Scheme: {scheme}, Shots: {shots}, Buffer: {buffer_size}")
+        logger.debug("Received data length: %s", num_samples)
+        logger.debug("Scheme: %s, Shots: %s, Buffer: %s", scheme, shots, buffer_size)
 
         # Initialize the scheme
         try:
-            qa_scheme = quantumaudio.load_scheme(scheme)
+            qa_scheme = get_scheme(scheme)
             if qa_scheme is None:
                 raise ValueError(f"Scheme '{scheme}' returned None - may not be implemented")
         except Exception as scheme_error:
-            print(f"[CELERY ERROR] Failed to load scheme '{scheme}': {scheme_error}")
+            logger.error("Failed to load scheme '%s': %s", scheme, scheme_error)
             raise ValueError(f"Scheme '{scheme}' is not available or not implemented: {scheme_error}")
         
-        # Process audio - quantumaudio.stream() doesn't take buffer_size
-        # Instead, it processes the entire audio through quantum circuits
-        print(f"[CELERY DEBUG] Using stream processing")
-        processed = quantumaudio.stream(
-            data,
-            scheme=qa_scheme,
-            shots=shots
-        )
-        
-        # Ensure output is normalized
-        processed = np.clip(processed, -1.0, 1.0)
+        if num_samples > 4 * buffer_size:
+            # Enough buffers to be worth fanning out across processes
+            logger.debug("Using parallel buffer processing")
+            processed = _parallel_stream(data, scheme, shots, buffer_size)
+        elif num_samples > buffer_size:
+            logger.debug("Using stream processing")
+            processed = quantumaudio.stream(
+                data,
+                scheme=qa_scheme,
+                chunk_size=buffer_size,
+                shots=shots
+            )
+        else:
+            circuit = qa_scheme.encode(data, verbose=0)
+            processed = qa_scheme.decode(circuit, shots=shots)
         
-        print(f"[CELERY DEBUG] Processed length: {len(processed)}")
+        return _build_result(processed, scheme, shots, buffer_size, sample_rate, input_hash)
         
+    except Exception as e:
         return {
-            'status': 'success',
-            'audio': processed.tolist(),
-            'metadata': {
-                'scheme': scheme,
-                'shots': shots,
-                'buffer_size': buffer_size,
-                'sample_rate': sample_rate,
-                'samples': len(processed),
-                'duration': len(processed) / sample_rate
-            }
+            'status': 'error',
+            'error': str(e)
         }
+
+
+@shared_task(bind=True, name='quantumsynth.process_chunk')
+def process_chunk(
+    self,
+    offset: int,
+    chunk_bytes: bytes,
+    shape: tuple,
+    scheme: str = 'qpam',
+    shots: int = 4000
+) -> Tuple[int, np.ndarray]:
+    """
+    Process a single buffer of audio through quantum circuit
+    
+    Runs as part of a chord, so errors are raised rather than returned
+    to fail the whole job.
+    
+    Args:
+        offset: Sample index of the buffer within the full audio
+        chunk_bytes: Raw float32 samples of one buffer
+        shape: Shape of the buffer encoded in chunk_bytes
+        scheme: Quantum encoding scheme to use
+        shots: Number of quantum measurements
+        
+    Returns:
+        The offset and the processed float32 buffer
+    """
+    chunk = np.frombuffer(chunk_bytes, dtype=np.float32).reshape(shape)
+    processed = process_buffer((chunk, scheme, shots))
+    return offset, np.asarray(processed, dtype=np.float32)
+
+
+@shared_task(bind=True, name='quantumsynth.finalize_audio')
+def finalize_audio(
+    self,
+    chunk_results: list,
+    shape: tuple,
+    scheme: str = 'qpam',
+    shots: int = 4000,
+    buffer_size: int = 256,
+    sample_rate: int = 22050,
+    input_hash: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Join processed buffers from a process_chunk chord
+    
+    Args:
+        chunk_results: (offset, float32 buffer) pairs from process_chunk
+        shape: Shape of the original audio array
+        scheme: Quantum encoding scheme used
+        shots: Number of quantum measurements
+        buffer_size: Size of processing chunks
+        sample_rate: Audio sample rate
+        input_hash: Cache key of the upload; when set the result is stored
+        
+    Returns:
+        Dictionary containing processed audio (float32 ndarray) and metadata
+    """
+    try:
+        # Buffers were cut along the sample axis; leading (channel) dims are
+        # unchanged. Each one is copied straight into a single output array.
+        processed = np.empty(shape, dtype=np.float32)
+        for offset, chunk_out in chunk_results:
+            chunk_out = chunk_out[..., :shape[-1] - offset]  # drop zero padding
+            processed[..., offset:offset + chunk_out.shape[-1]] = chunk_out
+        return _build_result(processed, scheme, shots, buffer_size, sample_rate, input_hash)
         
     except Exception as e:
         return {
@@ -99,52 +313,30 @@ def process_audio_file(
         buffer_size: Size of processing chunks
         
     Returns:
-        Dictionary with processed audio data
+        Dictionary with processed audio (float32 ndarray) and metadata
     """
     try:
-        # Load audio file
-        data, sample_rate = sf.read(audio_file_path)
+        # Load audio file - libsndfile decodes straight to float32 in [-1.0, 1.0]
+        data, sample_rate = sf.read(audio_file_path, dtype='float32', always_2d=False)
         
         # Convert to mono if stereo (or use multi-channel schemes)
         if len(data.shape) > 1:
-            if scheme in ['mqsm', 'msqpam']:
+            if scheme in MULTI_CHANNEL_SCHEMES:
                 # Keep stereo for multi-channel schemes
                 data = data.T  # Transpose to (channels, samples)
             else:
                 # Convert to mono
                 data = np.mean(data, axis=1)
         
-        # Normalize to -1.0 to 1.0 range
-        if data.dtype == np.int16:
-            data = data.astype(np.float32) / 32768.0
-        elif data.dtype == np.int32:
-            data = data.astype(np.float32) / 2147483648.0
-        
-        # Process through quantum circuit
-        qa_scheme = quantumaudio.load_scheme(scheme)
-        
-        if len(data) > buffer_size:
-            processed = quantumaudio.stream(
-                data,
-                scheme=qa_scheme,
-                buffer_size=buffer_size,
-                shots=shots
-            )
-        else:
-            circuit = qa_scheme.encode(data)
-            processed = qa_scheme.decode(circuit, shots=shots)
-        
-        return {
-            'status': 'success',
-            'audio': processed.tolist(),
-            'metadata': {
-                'scheme': scheme,
-                'shots': shots,
-                'sample_rate': int(sample_rate),
-                'samples': len(processed),
-                'duration': len(processed) / sample_rate
-            }
-        }
+        # Quantum processing is shared with audio decoded by the web process
+        return process_quantum_audio(
+            data.tobytes(),
+            data.shape,
+            scheme=scheme,
+            shots=shots,
+            buffer_size=buffer_size,
+            sample_rate=int(sample_rate)
+        )
         
     except Exception as e:
         return {
@@ -7,6 +7,7 @@ from . import views
 
 router = DefaultRouter()
 router.register(r'patches', views.QuantumPatchViewSet, basename='patch')
+router.register(r'samples', views.ProcessedSampleViewSet, basename='sample')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -4,24 +4,129 @@ Views for Quantum Synth API
 from rest_framework import viewsets, status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from celery import chord
 from celery.result import AsyncResult
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.http import FileResponse
 import numpy as np
-import soundfile as sf
 import io
+import base64
 import hashlib
+import logging
 import quantumaudio
 import librosa
 
+from .audio import (
+    MULTI_CHANNEL_SCHEMES,
+    get_scheme,
+    effective_shots,
+    effective_buffer_size,
+    split_buffers
+)
 from .models import QuantumPatch, ProcessedSample
 from .serializers import (
     QuantumPatchSerializer,
     ProcessedSampleSerializer,
-    AudioProcessRequestSerializer,
-    TaskStatusSerializer
+    AudioProcessRequestSerializer
 )
-from .tasks import process_quantum_audio, process_audio_file
+from .tasks import process_chunk, finalize_audio
+
+logger = logging.getLogger(__name__)
+
+
+def _buffer_size(scheme: str, buffer_size: int) -> int:
+    """
+    Requested buffer size, capped for schemes with deep circuits
+    """
+    # Optimize buffer size for complex schemes to reduce circuit depth
+    if scheme in ['sqpam', 'qsm', 'mqsm']:
+        return min(buffer_size, 128)  # Smaller buffers = smaller circuits = faster
+    return buffer_size
+
+
+def _input_hash(audio_file, scheme: str, shots: int, buffer_size: int) -> str:
+    """
+    Cache key for an upload processed with the given settings
+
+    The upload is hashed chunk by chunk so it never has to be held as one
+    bytes object, and the file is rewound for the caller afterwards.
+    buffer_size decides how the clip is split into circuits, so it is part
+    of the key alongside scheme and shots.
+    """
+    digest = hashlib.sha256()
+    for chunk in audio_file.chunks():
+        digest.update(chunk)
+    digest.update(scheme.encode())
+    digest.update(shots.to_bytes(4, 'little'))
+    digest.update(buffer_size.to_bytes(4, 'little'))
+    audio_file.seek(0)
+    return digest.hexdigest()
+
+
+def _audio_source(audio_file):
+    """
+    Source librosa can read an upload from without copying it
+
+    Large uploads are already spooled to disk, so libsndfile can read the
+    file directly; small ones are handed over as their in-memory buffer.
+    """
+    if isinstance(audio_file, TemporaryUploadedFile):
+        return audio_file.temporary_file_path()
+    return audio_file.file
+
+
+def _decode_audio(audio_file, scheme: str):
+    """
+    Decode an upload once into float32 samples in [-1.0, 1.0]
+
+    Returns (data, sample_rate). Only multi-channel schemes keep every
+    channel as (channels, samples); librosa downmixes the rest while decoding.
+    """
+    # librosa handles more formats than soundfile alone (WebM, MP3, etc.)
+    return librosa.load(
+        _audio_source(audio_file),
+        sr=None,
+        mono=scheme not in MULTI_CHANNEL_SCHEMES,
+        dtype=np.float32
+    )
+
+
+def _audio_payload(audio: np.ndarray) -> dict:
+    """
+    JSON-ready form of a float32 audio array
+
+    Samples are sent as base64-encoded raw bytes plus their shape, which is
+    far cheaper to serialize than a list of floats.
+    """
+    return {
+        'audio': base64.b64encode(audio.tobytes()).decode('ascii'),
+        'shape': list(audio.shape),
+    }
+
+
+def _cached_audio(input_hash: str, scheme: str):
+    """
+    Look up previously processed audio for an upload
+
+    Returns (audio, sample_rate) or None when nothing is cached
+    """
+    sample = (
+        ProcessedSample.objects
+        .filter(input_hash=input_hash, patch__scheme=scheme)
+        .only('output_audio', 'storage_dtype', 'sample_rate', 'channels', 'duration')
+        .first()
+    )
+    if sample is None:
+        return None
+
+    if sample.storage_dtype == 'int16':
+        audio = np.frombuffer(sample.output_audio, dtype=np.int16).astype(np.float32)
+        audio /= 32767.0
+    else:
+        audio = np.frombuffer(sample.output_audio, dtype=np.float32)
+    if sample.channels > 1:
+        audio = audio.reshape(sample.channels, -1)
+    return audio, sample.sample_rate
 
 
 class QuantumPatchViewSet(viewsets.ModelViewSet):
@@ -32,6 +137,35 @@ class QuantumPatchViewSet(viewsets.ModelViewSet):
     serializer_class = QuantumPatchSerializer
 
 
+class ProcessedSampleViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Read-only ViewSet for cached Processed Samples
+    """
+    # Join the patch up front so patch_name doesn't cost a query per row,
+    # and leave the output_audio blob out of listings
+    queryset = ProcessedSample.objects.select_related('patch').only(
+        'id',
+        'patch__name',
+        'input_hash',
+        'sample_rate',
+        'duration',
+        'created_at'
+    )
+    serializer_class = ProcessedSampleSerializer
+    
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
+        # Stream rows in batches instead of caching the whole result set
+        serializer = self.get_serializer(queryset.iterator(chunk_size=200), many=True)
+        return Response(serializer.data)
+
+
 @api_view(['POST'])
 def process_audio(request):
     """
@@ -50,47 +184,64 @@ def process_audio(request):
     audio_file = serializer.validated_data['audio']
     scheme = serializer.validated_data.get('scheme', 'qpam')
     shots = serializer.validated_data.get('shots', 4000)
-    buffer_size = serializer.validated_data.get('buffer_size', 256)
-    
-    # Optimize buffer size for complex schemes to reduce circuit depth
-    if scheme in ['sqpam', 'qsm', 'mqsm']:
-        buffer_size = min(buffer_size, 128)  # Smaller buffers = smaller circuits = faster
+    buffer_size = _buffer_size(scheme, serializer.validated_data.get('buffer_size', 256))
     
     try:
-        # Read audio file using librosa (handles more formats than soundfile)
-        audio_bytes = audio_file.read()
-        
-        print(f"[DEBUG] Received audio file: {len(audio_bytes)} bytes")
-        print(f"[DEBUG] Scheme: {scheme}, Shots: {shots}")
+        logger.debug("Received audio file: %s bytes", audio_file.size)
+        logger.debug("Scheme: %s, Shots: %s", scheme, shots)
         
-        # Use librosa to load audio - it can handle WebM, MP3, etc.
-        import librosa
-        data, sample_rate = librosa.load(io.BytesIO(audio_bytes), sr=None, mono=False)
+        # Repeat uploads are served straight from the ProcessedSample cache
+        input_hash = _input_hash(audio_file, scheme, shots, buffer_size)
+        cached = _cached_audio(input_hash, scheme)
+        if cached is not None:
+            audio, sample_rate = cached
+            # Report the settings the stored audio was actually processed with
+            return Response({
+                'task_id': None,
+                'status': 'cached',
+                'message': 'Audio served from cache',
+                'result': {
+                    'status': 'success',
+                    **_audio_payload(audio),
+                    'metadata': {
+                        'scheme': scheme,
+                        'shots': effective_shots(shots, audio.shape[-1]),
+                        'buffer_size': effective_buffer_size(buffer_size, audio.shape[-1]),
+                        'sample_rate': sample_rate,
+                        'samples': audio.shape[-1],
+                        'duration': audio.shape[-1] / sample_rate
+                    }
+                }
+            })
         
-        print(f"[DEBUG] Loaded audio shape: {data.shape}, sample_rate: {sample_rate}")
+        data, sample_rate = _decode_audio(audio_file, scheme)
         
-        # Librosa returns (samples,) for mono or (channels, samples) for stereo
-        # Ensure we have the right shape
-        if len(data.shape) == 1:
-            # Mono audio
-            pass  # Already correct shape
-        elif len(data.shape) == 2:
-            # Multi-channel - convert to mono if scheme doesn't support multi-channel
-            if scheme not in ['mqsm', 'msqpam']:
-                data = np.mean(data, axis=0)
+        logger.debug("Loaded audio shape: %s, sample_rate: %s", data.shape, sample_rate)
         
-        print(f"[DEBUG] Final data shape: {data.shape}, length: {len(data)}")
+        # Size circuits and measurements to the clip actually received
+        num_samples = data.shape[-1]
+        shots = effective_shots(shots, num_samples)
+        buffer_size = effective_buffer_size(buffer_size, num_samples)
         
-        # Librosa already returns float32 normalized to [-1, 1]
-        
-        # Start async task
-        task = process_quantum_audio.delay(
-            data.tolist(),
+        # Fan buffers out across workers, then join them in a single callback.
+        # Buffers travel as raw float32 bytes instead of lists of floats.
+        task = chord([
+            process_chunk.s(
+                start,
+                chunk.astype(np.float32, copy=False).tobytes(),
+                chunk.shape,
+                scheme=scheme,
+                shots=shots
+            )
+            for start, chunk in split_buffers(data, buffer_size)
+        ])(finalize_audio.s(
+            data.shape,
             scheme=scheme,
             shots=shots,
             buffer_size=buffer_size,
-            sample_rate=int(sample_rate)
-        )
+            sample_rate=int(sample_rate),
+            input_hash=input_hash
+        ))
         
         return Response({
             'task_id': task.id,
@@ -109,6 +260,9 @@ def process_audio(request):
 def task_status(request, task_id):
     """
     Check status of a Celery task
+    
+    Pass ?audio=raw to download a finished result as raw float32 samples
+    instead of JSON; shape and sample rate are sent as headers.
     """
     task_result = AsyncResult(task_id)
     
@@ -121,7 +275,20 @@ def task_status(request, task_id):
         if task_result.successful():
             result = task_result.result
             if isinstance(result, dict) and result.get('status') == 'success':
-                response_data['result'] = result
+                # Audio stays an ndarray until this HTTP boundary
+                audio = result['audio']
+                if request.query_params.get('audio') == 'raw':
+                    response = FileResponse(
+                        io.BytesIO(audio.tobytes()),
+                        as_attachment=True,
+                        filename='audio.f32',
+                        content_type='application/octet-stream'
+                    )
+                    response['X-Audio-Shape'] = ','.join(str(n) for n in audio.shape)
+                    response['X-Sample-Rate'] = str(result['metadata']['sample_rate'])
+                    return response
+                
+                response_data['result'] = {**result, **_audio_payload(audio)}
             else:
                 response_data['status'] = 'FAILURE'
                 response_data['error'] = result.get('error', 'Unknown error')
@@ -151,34 +318,32 @@ def quick_process(request):
     shots = serializer.validated_data.get('shots', 4000)
     
     try:        
-        # Read audio using librosa (handles WebM, MP3, etc.)
-        audio_bytes = audio_file.read()
-        data, sample_rate = librosa.load(io.BytesIO(audio_bytes), sr=None, mono=False)
-        
-        # Handle mono/stereo
-        if len(data.shape) == 2 and scheme not in ['mqsm', 'msqpam']:
-            data = np.mean(data, axis=0)
+        data, sample_rate = _decode_audio(audio_file, scheme)
         
         # Limit to short clips only
-        if len(data) > 2048:
+        if data.shape[-1] > 2048:
             return Response(
                 {'error': 'Audio too long for quick processing. Use /process/ endpoint.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         # Process - load scheme first, then use stream
-        print(f"[DEBUG] Loading scheme: {scheme}")
+        logger.debug("Loading scheme: %s", scheme)
         try:
-            qa_scheme = quantumaudio.load_scheme(scheme)
+            qa_scheme = get_scheme(scheme)
             if qa_scheme is None:
                 raise ValueError(f"Scheme '{scheme}' is not implemented in quantumaudio")
         except Exception as scheme_error:
-            print(f"[DEBUG] Failed to load scheme '{scheme}': {scheme_error}")
+            logger.error("Failed to load scheme '%s': %s", scheme, scheme_error)
             raise ValueError(f"Scheme '{scheme}' is not available: {scheme_error}")
 
-        print(f"[DEBUG] Scheme loaded, processing...")
-        processed = quantumaudio.stream(data, scheme=qa_scheme, shots=shots)
-        print(f"[DEBUG] Processing complete, output shape: {processed.shape}")
+        logger.debug("Scheme loaded, processing...")
+        processed = quantumaudio.stream(
+            data,
+            scheme=qa_scheme,
+            shots=effective_shots(shots, data.shape[-1])
+        )
+        logger.debug("Processing complete, output shape: %s", processed.shape)
 
         # Handle both mono and multi-channel output
         num_samples = processed.shape[-1] if len(processed.shape) > 1 else len(processed)
@@ -190,7 +355,7 @@ def quick_process(request):
         })
 
     except Exception as e:
-        print(f"[DEBUG] Quick process error: {e}")
+        logger.exception("Quick process error: %s", e)
         return Response(
             {'error': str(e)},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -81,7 +81,7 @@ const QuantumSynth: React.FC<QuantumSynthProps> = () => {
         // Fall back to async processing
         const response = await processAudio(recording, scheme, shots);
         console.log('Async process started:', response);
-        const result = await pollForResult(response.task_id);
+        const result = response.result ?? await pollForResult(response.task_id!);
         console.log('Async process complete:', result);
 
         if (result.audio) {
@@ -2,26 +2,48 @@ import axios from 'axios';
 
 const API_BASE_URL = '/api/quantum';
 
+interface TaskResult {
+  status: string;
+  audio: number[] | number[][];
+  metadata: {
+    scheme: string;
+    shots: number;
+    sample_rate: number;
+    samples: number;
+    duration: number;
+  };
+}
+
+interface RawTaskResult extends Omit<TaskResult, 'audio'> {
+  audio: string;  // base64-encoded float32 samples
+  shape: number[];
+}
+
+interface RawProcessAudioResponse {
+  task_id: string | null;
+  status: string;
+  message: string;
+  result?: RawTaskResult;  // present when served from cache
+}
+
 interface ProcessAudioResponse {
-  task_id: string;
+  task_id: string | null;
   status: string;
   message: string;
+  result?: TaskResult;
+}
+
+interface RawTaskStatusResponse {
+  task_id: string;
+  status: string;
+  result?: RawTaskResult;
+  error?: string;
 }
 
 interface TaskStatusResponse {
   task_id: string;
   status: string;
-  result?: {
-    status: string;
-    audio: number[];
-    metadata: {
-      scheme: string;
-      shots: number;
-      sample_rate: number;
-      samples: number;
-      duration: number;
-    };
-  };
+  result?: TaskResult;
   error?: string;
 }
 
@@ -37,6 +59,29 @@ interface QuantumPatch {
   updated_at: string;
 }
 
+const decodeAudio = (encoded: string, shape: number[]): number[] | number[][] => {
+  const binary = atob(encoded);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  const samples = Array.from(new Float32Array(bytes.buffer));
+
+  // Mono audio has shape [samples], multi-channel has [channels, samples]
+  if (shape.length < 2) {
+    return samples;
+  }
+  const [channels, length] = shape;
+  return Array.from({ length: channels }, (_, ch) =>
+    samples.slice(ch * length, (ch + 1) * length)
+  );
+};
+
+const decodeResult = ({ audio, shape, ...fields }: RawTaskResult): TaskResult => ({
+  ...fields,
+  audio: decodeAudio(audio, shape),
+});
+
 export const processAudio = async (
   audioBlob: Blob,
   scheme: string,
@@ -49,7 +94,7 @@ export const processAudio = async (
   formData.append('shots', shots.toString());
   formData.append('buffer_size', bufferSize.toString());
 
-  const response = await axios.post<ProcessAudioResponse>(
+  const response = await axios.post<RawProcessAudioResponse>(
     `${API_BASE_URL}/process/`,
     formData,
     {
@@ -59,14 +104,16 @@ export const processAudio = async (
     }
   );
 
-  return response.data;
+  const { result, ...rest } = response.data;
+  return result ? { ...rest, result: decodeResult(result) } : rest;
 };
 
 export const checkTaskStatus = async (taskId: string): Promise<TaskStatusResponse> => {
-  const response = await axios.get<TaskStatusResponse>(
+  const response = await axios.get<RawTaskStatusResponse>(
     `${API_BASE_URL}/task/${taskId}/`
   );
-  return response.data;
+  const { result, ...rest } = response.data;
+  return result ? { ...rest, result: decodeResult(result) } : rest;
 };
 
 export const getPatches = async (): Promise<QuantumPatch[]> => {